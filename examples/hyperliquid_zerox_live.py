@@ -178,14 +178,14 @@ class LiveTradingSystem:
         self.exec_engine.register_client(self.hyperliquid_exec)
         self.exec_engine.register_client(self.zerox_exec)
         
-        # Connect to exchanges
-        print("   Connecting to Hyperliquid...")
-        await self.hyperliquid_data._connect()
-        await self.hyperliquid_exec._connect()
-        
-        print("   Connecting to 0x (Arbitrum)...")
-        await self.zerox_data._connect()
-        await self.zerox_exec._connect()
+        # Connect to exchanges (concurrently, bounded by the slowest venue)
+        print("   Connecting to Hyperliquid and 0x (Arbitrum)...")
+        await asyncio.gather(
+            self.hyperliquid_data._connect(),
+            self.hyperliquid_exec._connect(),
+            self.zerox_data._connect(),
+            self.zerox_exec._connect(),
+        )
         
         # Create Trader
         print("   Creating Trader...")
@@ -257,14 +257,24 @@ class LiveTradingSystem:
         if self.data_engine:
             self.data_engine.stop()
         
-        if self.hyperliquid_data:
-            await self.hyperliquid_data._disconnect()
-        if self.hyperliquid_exec:
-            await self.hyperliquid_exec._disconnect()
-        if self.zerox_data:
-            await self.zerox_data._disconnect()
-        if self.zerox_exec:
-            await self.zerox_exec._disconnect()
+        # Disconnect concurrently; one failing venue must not block the others
+        clients = [
+            client
+            for client in (
+                self.hyperliquid_data,
+                self.hyperliquid_exec,
+                self.zerox_data,
+                self.zerox_exec,
+            )
+            if client is not None
+        ]
+        results = await asyncio.gather(
+            *(client._disconnect() for client in clients),
+            return_exceptions=True,
+        )
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error disconnecting {client.id}: {result}")
         
         print("\n✅ Shutdown complete")
 
@@ -10,6 +10,7 @@ Usage:
 
 import asyncio
 import argparse
+import json
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -22,6 +23,29 @@ sys.path.insert(0, str(project_root))
 from src.crypto_trading_engine.data.historical_loader import HistoricalDataLoader
 
 
+def bars_to_frame(bars) -> pd.DataFrame:
+    """Build a bars DataFrame column by column (no per-row dicts)."""
+    return pd.DataFrame({
+        'timestamp': [datetime.fromtimestamp(bar.ts_event / 1e9) for bar in bars],
+        'open': [float(bar.open) for bar in bars],
+        'high': [float(bar.high) for bar in bars],
+        'low': [float(bar.low) for bar in bars],
+        'close': [float(bar.close) for bar in bars],
+        'volume': [float(bar.volume) for bar in bars],
+    })
+
+
+def ticks_to_frame(ticks) -> pd.DataFrame:
+    """Build a quote ticks DataFrame column by column (no per-row dicts)."""
+    return pd.DataFrame({
+        'timestamp': [datetime.fromtimestamp(tick.ts_event / 1e9) for tick in ticks],
+        'bid_price': [float(tick.bid_price) for tick in ticks],
+        'ask_price': [float(tick.ask_price) for tick in ticks],
+        'bid_size': [float(tick.bid_size) for tick in ticks],
+        'ask_size': [float(tick.ask_size) for tick in ticks],
+    })
+
+
 def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path):
     """
     Save data to Parquet files organized by date.
@@ -47,10 +71,15 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
     def group_by_date(items, get_timestamp):
         """Group items by date."""
         by_date = {}
+        # Local date only changes on minute boundaries, so format once per minute
+        date_by_minute = {}
         for item in items:
-            ts = get_timestamp(item)
-            date = datetime.fromtimestamp(ts / 1e9).date()
-            date_str = date.strftime("%Y-%m-%d")
+            minute = get_timestamp(item) // 60_000_000_000
+            date_str = date_by_minute.get(minute)
+            if date_str is None:
+                date = datetime.fromtimestamp(minute * 60).date()
+                date_str = date.strftime("%Y-%m-%d")
+                date_by_minute[minute] = date_str
             if date_str not in by_date:
                 by_date[date_str] = []
             by_date[date_str].append(item)
@@ -97,17 +126,7 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
         # Save Binance bars
         if date_str in binance_bars_by_date:
             bars = binance_bars_by_date[date_str]
-            df = pd.DataFrame([
-                {
-                    'timestamp': datetime.fromtimestamp(bar.ts_event / 1e9),
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': float(bar.volume),
-                }
-                for bar in bars
-            ])
+            df = bars_to_frame(bars)
             filepath = date_dir / "binance_btcusdt_bars.parquet"
             df.to_parquet(filepath, index=False, compression='snappy')
             total_files += 1
@@ -115,16 +134,7 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
         # Save Binance ticks
         if date_str in binance_ticks_by_date:
             ticks = binance_ticks_by_date[date_str]
-            df = pd.DataFrame([
-                {
-                    'timestamp': datetime.fromtimestamp(tick.ts_event / 1e9),
-                    'bid_price': float(tick.bid_price),
-                    'ask_price': float(tick.ask_price),
-                    'bid_size': float(tick.bid_size),
-                    'ask_size': float(tick.ask_size),
-                }
-                for tick in ticks
-            ])
+            df = ticks_to_frame(ticks)
             filepath = date_dir / "binance_btcusdt_ticks.parquet"
             df.to_parquet(filepath, index=False, compression='snappy')
             total_files += 1
@@ -132,17 +142,7 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
         # Save dYdX bars
         if date_str in dydx_bars_by_date:
             bars = dydx_bars_by_date[date_str]
-            df = pd.DataFrame([
-                {
-                    'timestamp': datetime.fromtimestamp(bar.ts_event / 1e9),
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': float(bar.volume),
-                }
-                for bar in bars
-            ])
+            df = bars_to_frame(bars)
             filepath = date_dir / "dydx_btcusd_bars.parquet"
             df.to_parquet(filepath, index=False, compression='snappy')
             total_files += 1
@@ -150,16 +150,7 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
         # Save dYdX ticks
         if date_str in dydx_ticks_by_date:
             ticks = dydx_ticks_by_date[date_str]
-            df = pd.DataFrame([
-                {
-                    'timestamp': datetime.fromtimestamp(tick.ts_event / 1e9),
-                    'bid_price': float(tick.bid_price),
-                    'ask_price': float(tick.ask_price),
-                    'bid_size': float(tick.bid_size),
-                    'ask_size': float(tick.ask_size),
-                }
-                for tick in ticks
-            ])
+            df = ticks_to_frame(ticks)
             filepath = date_dir / "dydx_btcusd_ticks.parquet"
             df.to_parquet(filepath, index=False, compression='snappy')
             total_files += 1
@@ -204,7 +195,6 @@ def save_to_parquet(data: dict, start_date: str, end_date: str, output_dir: Path
     }
     
     index_file = output_dir / "index.json"
-    import json
     
     # Load existing index if it exists
     existing_index = []
@@ -290,7 +280,6 @@ def list_available_data(data_dir: Path):
     index_file = data_dir / "index.json"
     
     if index_file.exists():
-        import json
         with open(index_file, 'r') as f:
             index = json.load(f)
         
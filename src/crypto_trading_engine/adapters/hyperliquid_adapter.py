@@ -18,6 +18,7 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime
 
 import aiohttp
+import websockets
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
@@ -28,6 +29,7 @@ from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.messages import (
     SubmitOrder,
+    SubmitOrderList,
     CancelOrder,
     ModifyOrder,
 )
@@ -36,6 +38,7 @@ from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import (
     AccountType,
+    ContingencyType,
     LiquiditySide,
     OmsType,
     OrderSide,
@@ -66,9 +69,31 @@ from nautilus_trader.model.objects import (
 )
 from nautilus_trader.msgbus.bus import MessageBus
 
+# Use orjson for WebSocket message decoding when installed (optional speedup)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 VENUE = Venue("HYPERLIQUID")
 
+# Instrument parameters shared by every Hyperliquid perpetual
+PRICE_INCREMENT = Price.from_str("0.01")
+MIN_PRICE = Price.from_str("0.01")
+MAX_PRICE = Price.from_str("1000000")
+MAX_QUANTITY = Quantity.from_str("1000000")
+MARGIN_INIT = Decimal("0.02")  # 50x max leverage
+MARGIN_MAINT = Decimal("0.01")
+MAKER_FEE = Decimal("-0.00002")  # Maker rebate
+TAKER_FEE = Decimal("0.00035")
+
+# Hyperliquid order type payloads (built once, reused for every order)
+ORDER_TYPES = {
+    OrderType.LIMIT: {"limit": {"tif": "Gtc"}},
+    OrderType.MARKET: {"market": {}},
+}
+
 
 class HyperliquidHttpClient:
     """HTTP client for Hyperliquid API"""
@@ -94,7 +119,7 @@ class HyperliquidHttpClient:
         if testnet:
             self.BASE_URL = "https://api.hyperliquid-testnet.xyz"
     
-    async def _get_session(self) -> aiohttp.ClientSession:
+    def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None:
             self._session = aiohttp.ClientSession()
         return self._session
@@ -113,14 +138,14 @@ class HyperliquidHttpClient:
         signed: bool = False,
     ) -> Dict:
         """Make HTTP request"""
-        session = await self._get_session()
+        session = self._get_session()
         url = f"{self.BASE_URL}{endpoint}"
         
         headers = {"Content-Type": "application/json"}
         
         if signed and data:
             # Add signature
-            timestamp = int(time.time() * 1000)
+            timestamp = time.time_ns() // 1_000_000
             data["timestamp"] = timestamp
             message = json.dumps(data, separators=(',', ':'))
             signature = self._sign_message(message)
@@ -158,16 +183,20 @@ class HyperliquidHttpClient:
         reduce_only: bool = False,
     ) -> Dict:
         """Place order"""
+        return await self.place_orders([{
+            "coin": coin,
+            "is_buy": is_buy,
+            "sz": sz,
+            "limit_px": limit_px,
+            "order_type": order_type,
+            "reduce_only": reduce_only,
+        }])
+    
+    async def place_orders(self, orders: List[Dict]) -> Dict:
+        """Place several orders in one signed request"""
         data = {
             "type": "order",
-            "orders": [{
-                "coin": coin,
-                "is_buy": is_buy,
-                "sz": sz,
-                "limit_px": limit_px,
-                "order_type": order_type,
-                "reduce_only": reduce_only,
-            }],
+            "orders": orders,
             "grouping": "na",
         }
         return await self._request("POST", "/exchange", data=data, signed=True)
@@ -254,9 +283,13 @@ class HyperliquidDataClient(LiveMarketDataClient):
         meta = await self._client.get_meta()
         universe = meta.get("universe", [])
         
+        # One timestamp for the whole load
+        ts_now = self._clock.timestamp_ns()
+        
         for asset in universe:
             coin = asset["name"]
             sz_decimals = asset["szDecimals"]
+            size_increment = Quantity.from_str(f"0.{'0' * (sz_decimals - 1)}1")
             
             # Create instrument
             instrument_id = InstrumentId(Symbol(f"{coin}-PERP"), VENUE)
@@ -270,18 +303,18 @@ class HyperliquidDataClient(LiveMarketDataClient):
                 is_inverse=False,
                 price_precision=2,
                 size_precision=sz_decimals,
-                price_increment=Price.from_str("0.01"),
-                size_increment=Quantity.from_str(f"0.{'0' * (sz_decimals - 1)}1"),
-                max_quantity=Quantity.from_str("1000000"),
-                min_quantity=Quantity.from_str(f"0.{'0' * (sz_decimals - 1)}1"),
-                max_price=Price.from_str("1000000"),
-                min_price=Price.from_str("0.01"),
-                margin_init=Decimal("0.02"),  # 50x max leverage
-                margin_maint=Decimal("0.01"),
-                maker_fee=Decimal("-0.00002"),  # Maker rebate
-                taker_fee=Decimal("0.00035"),
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                price_increment=PRICE_INCREMENT,
+                size_increment=size_increment,
+                max_quantity=MAX_QUANTITY,
+                min_quantity=size_increment,
+                max_price=MAX_PRICE,
+                min_price=MIN_PRICE,
+                margin_init=MARGIN_INIT,
+                margin_maint=MARGIN_MAINT,
+                maker_fee=MAKER_FEE,
+                taker_fee=TAKER_FEE,
+                ts_event=ts_now,
+                ts_init=ts_now,
             )
             
             self._instruments[instrument_id] = instrument
@@ -291,9 +324,6 @@ class HyperliquidDataClient(LiveMarketDataClient):
     
     async def _update_loop(self):
         """Update loop for market data via WebSocket"""
-        import websockets
-        import json
-        
         ws_url = "wss://api.hyperliquid.xyz/ws" if not self._client.testnet else "wss://api.hyperliquid-testnet.xyz/ws"
         
         while True:
@@ -323,15 +353,16 @@ class HyperliquidDataClient(LiveMarketDataClient):
                     # Listen for messages
                     while True:
                         message = await websocket.recv()
-                        data = json.loads(message)
+                        data = json_loads(message)
                         
                         # Handle different message types
-                        if data.get("channel") == "allMids":
+                        channel = data.get("channel")
+                        if channel == "allMids":
                             # Price updates
                             mids = data.get("data", {}).get("mids", {})
                             # TODO: Convert to Nautilus quote ticks
                             
-                        elif data.get("channel") == "user":
+                        elif channel == "user":
                             # User events (fills, orders, etc.)
                             user_data = data.get("data", [])
                             for event in user_data:
@@ -381,6 +412,7 @@ class HyperliquidExecutionClient(LiveExecutionClient):
         self._client = client
         self._account_id = account_id
         self._order_id_map: Dict[ClientOrderId, int] = {}  # Nautilus -> Hyperliquid
+        self._coins: Dict[InstrumentId, str] = {}  # Nautilus -> Hyperliquid coin
     
     async def _connect(self):
         """Connect to Hyperliquid"""
@@ -414,6 +446,14 @@ class HyperliquidExecutionClient(LiveExecutionClient):
         # TODO: Generate account state event
         self._log.info(f"Account value: ${account_value:,.2f}")
     
+    def _coin(self, instrument_id: InstrumentId) -> str:
+        """Get Hyperliquid coin name for instrument"""
+        coin = self._coins.get(instrument_id)
+        if coin is None:
+            coin = instrument_id.symbol.value.replace("-PERP", "")
+            self._coins[instrument_id] = coin
+        return coin
+    
     def submit_order(self, command: SubmitOrder):
         """Submit order"""
         self._loop.create_task(self._submit_order(command))
@@ -422,55 +462,110 @@ class HyperliquidExecutionClient(LiveExecutionClient):
         """Submit order async"""
         try:
             order = command.order
-            
-            # Parse instrument
-            coin = order.instrument_id.symbol.value.replace("-PERP", "")
-            
-            # Convert order
-            is_buy = order.side == OrderSide.BUY
-            sz = float(order.quantity)
-            limit_px = float(order.price) if order.price else 0
-            
-            # Order type
-            if order.order_type == OrderType.LIMIT:
-                order_type = {"limit": {"tif": "Gtc"}}
-            elif order.order_type == OrderType.MARKET:
-                order_type = {"market": {}}
-            else:
-                self._log.error(f"Unsupported order type: {order.order_type}")
+            request = self._order_request(order)
+            if request is None:
                 return
             
-            # Place order
-            result = await self._client.place_order(
-                coin=coin,
-                is_buy=is_buy,
-                sz=sz,
-                limit_px=limit_px,
-                order_type=order_type,
-            )
+            result = await self._client.place_orders([request])
             
             # Parse result
             if result.get("status") == "ok":
-                response = result.get("response", {})
-                data = response.get("data", {})
-                statuses = data.get("statuses", [])
-                
-                if statuses and statuses[0].get("filled"):
-                    # Order filled
-                    filled = statuses[0]["filled"]
-                    oid = filled.get("oid")
-                    
-                    if oid:
-                        self._order_id_map[order.client_order_id] = oid
-                    
-                    self._log.info(f"Order filled: {order.client_order_id}")
-                    # TODO: Generate fill event
+                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                if statuses:
+                    self._handle_order_status(order, statuses[0])
             else:
                 self._log.error(f"Order rejected: {result}")
         
         except Exception as e:
             self._log.error(f"Error submitting order: {e}")
     
+    def submit_order_list(self, command: SubmitOrderList):
+        """Submit order list"""
+        self._loop.create_task(self._submit_order_list(command))
+    
+    async def _submit_order_list(self, command: SubmitOrderList):
+        """Submit order list async as a single exchange request"""
+        try:
+            order_list = command.order_list
+            
+            # Orders are sent ungrouped, so contingent legs would all go live at once
+            for order in order_list.orders:
+                if order.contingency_type != ContingencyType.NO_CONTINGENCY:
+                    self._log.error(
+                        f"Order list rejected: {order_list.id}: "
+                        f"contingent orders not supported ({order.client_order_id})"
+                    )
+                    return
+            
+            orders = []
+            requests = []
+            for order in order_list.orders:
+                request = self._order_request(order)
+                if request is None:
+                    self._log.error(
+                        f"Order list rejected: {order_list.id}: "
+                        f"unsupported order {order.client_order_id}"
+                    )
+                    return
+                orders.append(order)
+                requests.append(request)
+            
+            result = await self._client.place_orders(requests)
+            
+            # Statuses are returned in request order
+            if result.get("status") == "ok":
+                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                if len(statuses) != len(orders):
+                    self._log.error(
+                        f"Order list {order_list.id}: got {len(statuses)} statuses "
+                        f"for {len(orders)} orders: {result}"
+                    )
+                for order, status in zip(orders, statuses):
+                    self._handle_order_status(order, status)
+            else:
+                self._log.error(f"Order list rejected: {result}")
+        
+        except Exception as e:
+            self._log.error(f"Error submitting order list: {e}")
+    
+    def _order_request(self, order) -> Optional[Dict]:
+        """Convert Nautilus order to Hyperliquid order request"""
+        order_type = ORDER_TYPES.get(order.order_type)
+        if order_type is None:
+            self._log.error(f"Unsupported order type: {order.order_type}")
+            return None
+        
+        return {
+            "coin": self._coin(order.instrument_id),
+            "is_buy": order.side == OrderSide.BUY,
+            "sz": float(order.quantity),
+            "limit_px": float(order.price) if order.has_price else 0,
+            "order_type": order_type,
+            "reduce_only": False,
+        }
+    
+    def _handle_order_status(self, order, status: Dict):
+        """Handle a single order status from an exchange response"""
+        if status.get("resting"):
+            # Order resting on the book, keep its exchange ID for cancels
+            oid = status["resting"].get("oid")
+            
+            if oid:
+                self._order_id_map[order.client_order_id] = oid
+            
+            self._log.info(f"Order accepted: {order.client_order_id}")
+            # TODO: Generate accepted event
+        elif status.get("filled"):
+            # Order filled (terminal, nothing left to cancel)
+            self._order_id_map.pop(order.client_order_id, None)
+            
+            self._log.info(f"Order filled: {order.client_order_id}")
+            # TODO: Generate fill event
+        elif status.get("error"):
+            # Per-order rejection (response status is still "ok")
+            self._log.error(f"Order rejected: {order.client_order_id}: {status['error']}")
+            # TODO: Generate rejected event
+    
     def cancel_order(self, command: CancelOrder):
         """Cancel order"""
         self._loop.create_task(self._cancel_order(command))
@@ -484,18 +579,15 @@ class HyperliquidExecutionClient(LiveExecutionClient):
                 self._log.error(f"Order ID not found: {command.client_order_id}")
                 return
             
-            # Parse instrument
-            instrument = self._cache.instrument(command.instrument_id)
-            if not instrument:
-                self._log.error(f"Instrument not found: {command.instrument_id}")
-                return
-            
-            coin = instrument.raw_symbol.value
+            # Parse instrument (coin name cached by _coin on submit)
+            coin = self._coin(command.instrument_id)
             
             # Cancel order
             result = await self._client.cancel_order(coin=coin, oid=oid)
             
             if result.get("status") == "ok":
+                # Order is terminal, drop its exchange ID mapping
+                self._order_id_map.pop(command.client_order_id, None)
                 self._log.info(f"Order cancelled: {command.client_order_id}")
                 # TODO: Generate cancel event
             else:
@@ -10,7 +10,7 @@
 
 import asyncio
 from decimal import Decimal
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 from datetime import datetime
 import time
 
@@ -53,6 +53,12 @@ from nautilus_trader.msgbus.bus import MessageBus
 
 VENUE = Venue("ZEROX")
 
+# Instrument parameters shared by every 0x pair
+MAX_PRICE = Price.from_str("1000000")
+MAX_QUANTITY = Quantity.from_str("1000000")
+MARGIN = Decimal("1.0")  # No margin on DEX
+FEE = Decimal("0.0")  # 0x has no protocol fee; gas is the only cost
+
 # 0x API endpoints
 ZEROX_API_ARBITRUM = "https://arbitrum.api.0x.org"
 
@@ -66,6 +72,12 @@ TOKENS_ARBITRUM = {
     "ARB": "0x912CE59144191C1204E64559FE8253a0e49E6548",
 }
 
+# Swap tokens (base, quote) for each tradable instrument
+SWAP_TOKENS: Dict[InstrumentId, Tuple[str, str]] = {
+    InstrumentId(Symbol("WETHUSDC"), VENUE): (TOKENS_ARBITRUM["WETH"], TOKENS_ARBITRUM["USDC"]),
+    InstrumentId(Symbol("WETHUSDT"), VENUE): (TOKENS_ARBITRUM["WETH"], TOKENS_ARBITRUM["USDT"]),
+}
+
 # ERC20 ABI (minimal for approve and balanceOf)
 ERC20_ABI = [
     {
@@ -105,6 +117,11 @@ ERC20_ABI = [
 ]
 
 
+def _is_native_eth(token: str) -> bool:
+    """Check if token refers to native ETH (addresses skip the upper() copy)"""
+    return len(token) == 3 and token.upper() == "ETH"
+
+
 class ZeroXHttpClient:
     """HTTP client for 0x Protocol on Arbitrum"""
     
@@ -123,6 +140,9 @@ class ZeroXHttpClient:
         self._session = session
         self._own_session = session is None
         
+        # API headers are fixed for the client's lifetime
+        self._headers = {"0x-api-key": api_key} if api_key else {}
+        
         # Create Web3 instance (Arbitrum)
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
         self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
@@ -134,8 +154,16 @@ class ZeroXHttpClient:
         self.chain_id = self.w3.eth.chain_id
         if self.chain_id != 42161:
             print(f"Warning: Expected Arbitrum (42161), got chain {self.chain_id}")
+        
+        # ERC20 contracts and decimals by token address (decimals never change)
+        self._token_contracts: Dict[str, Any] = {}
+        self._token_decimals: Dict[str, int] = {}
+        
+        # Serializes nonce fetch, send and confirmation for the wallet; waiting
+        # transactions queue on the event loop rather than in worker threads
+        self._tx_lock = asyncio.Lock()
     
-    async def _get_session(self) -> aiohttp.ClientSession:
+    def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None:
             self._session = aiohttp.ClientSession()
         return self._session
@@ -144,33 +172,36 @@ class ZeroXHttpClient:
         self,
         sell_token: str,
         buy_token: str,
-        sell_amount: int,
+        sell_amount: Optional[int] = None,
         slippage_percentage: float = 0.01,
+        buy_amount: Optional[int] = None,
     ) -> Dict:
-        """Get swap quote from 0x API"""
-        session = await self._get_session()
+        """Get swap quote from 0x API (exactly one of sell_amount/buy_amount)"""
+        if (sell_amount is None) == (buy_amount is None):
+            raise ValueError("Exactly one of sell_amount or buy_amount must be set")
+        
+        session = self._get_session()
         
         params = {
             "sellToken": sell_token,
             "buyToken": buy_token,
-            "sellAmount": str(sell_amount),
             "slippagePercentage": str(slippage_percentage),
             "takerAddress": self.wallet_address,
         }
-        
-        headers = {}
-        if self.api_key:
-            headers["0x-api-key"] = self.api_key
+        if buy_amount is not None:
+            params["buyAmount"] = str(buy_amount)
+        else:
+            params["sellAmount"] = str(sell_amount)
         
         url = f"{ZEROX_API_ARBITRUM}/swap/v1/quote"
         
-        async with session.get(url, params=params, headers=headers) as response:
+        async with session.get(url, params=params, headers=self._headers) as response:
             response.raise_for_status()
             return await response.json()
     
     async def get_price(self, sell_token: str, buy_token: str, sell_amount: int) -> Dict:
         """Get price without executing swap"""
-        session = await self._get_session()
+        session = self._get_session()
         
         params = {
             "sellToken": sell_token,
@@ -178,38 +209,58 @@ class ZeroXHttpClient:
             "sellAmount": str(sell_amount),
         }
         
-        headers = {}
-        if self.api_key:
-            headers["0x-api-key"] = self.api_key
-        
         url = f"{ZEROX_API_ARBITRUM}/swap/v1/price"
         
-        async with session.get(url, params=params, headers=headers) as response:
+        async with session.get(url, params=params, headers=self._headers) as response:
             response.raise_for_status()
             return await response.json()
     
+    def _token_contract(self, token_address: str) -> Any:
+        """Get ERC20 contract for token"""
+        contract = self._token_contracts.get(token_address)
+        if contract is None:
+            contract = self.w3.eth.contract(
+                address=Web3.to_checksum_address(token_address),
+                abi=ERC20_ABI,
+            )
+            self._token_contracts[token_address] = contract
+        return contract
+    
+    def _decimals(self, token_address: str) -> int:
+        """Get ERC20 decimals for token"""
+        decimals = self._token_decimals.get(token_address)
+        if decimals is None:
+            decimals = self._token_contract(token_address).functions.decimals().call()
+            self._token_decimals[token_address] = decimals
+        return decimals
+    
+    async def token_decimals(self, token_address: str) -> int:
+        """Get ERC20 decimals for token (RPC lookup on a cache miss runs in a worker thread)"""
+        decimals = self._token_decimals.get(token_address)
+        if decimals is None:
+            decimals = await asyncio.to_thread(self._decimals, token_address)
+        return decimals
+    
     def get_balance(self, token_address: str) -> float:
         """Get token balance"""
-        if token_address.upper() == "ETH":
+        if _is_native_eth(token_address):
             # Native ETH balance
             balance_wei = self.w3.eth.get_balance(self.wallet_address)
             return float(self.w3.from_wei(balance_wei, 'ether'))
         else:
             # ERC20 token balance
-            token_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=ERC20_ABI,
-            )
+            token_contract = self._token_contract(token_address)
             balance = token_contract.functions.balanceOf(self.wallet_address).call()
-            decimals = token_contract.functions.decimals().call()
-            return float(balance) / (10 ** decimals)
+            return float(balance) / (10 ** self._decimals(token_address))
     
     async def approve_token(self, token_address: str, spender: str, amount: int) -> Optional[str]:
-        """Approve token spending"""
-        token_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=ERC20_ABI,
-        )
+        """Approve token spending (blocking RPC runs in a worker thread)"""
+        async with self._tx_lock:
+            return await asyncio.to_thread(self._approve_token, token_address, spender, amount)
+    
+    def _approve_token(self, token_address: str, spender: str, amount: int) -> Optional[str]:
+        """Approve token spending (blocking)"""
+        token_contract = self._token_contract(token_address)
         
         # Check current allowance
         allowance = token_contract.functions.allowance(
@@ -240,7 +291,12 @@ class ZeroXHttpClient:
         return receipt.transactionHash.hex()
     
     async def execute_swap(self, quote: Dict) -> str:
-        """Execute swap using 0x quote"""
+        """Execute swap using 0x quote (blocking RPC runs in a worker thread)"""
+        async with self._tx_lock:
+            return await asyncio.to_thread(self._execute_swap, quote)
+    
+    def _execute_swap(self, quote: Dict) -> str:
+        """Execute swap using 0x quote (blocking)"""
         # Build transaction from quote
         swap_txn = {
             'from': self.wallet_address,
@@ -271,23 +327,26 @@ class ZeroXHttpClient:
         self,
         sell_token: str,
         buy_token: str,
-        sell_amount: int,
+        sell_amount: Optional[int] = None,
         slippage_percentage: float = 0.01,
+        buy_amount: Optional[int] = None,
     ) -> str:
-        """Execute swap via 0x Protocol"""
+        """Execute swap via 0x Protocol (exactly one of sell_amount/buy_amount)"""
         # Get quote
         quote = await self.get_quote(
             sell_token=sell_token,
             buy_token=buy_token,
             sell_amount=sell_amount,
             slippage_percentage=slippage_percentage,
+            buy_amount=buy_amount,
         )
         
         # Approve token if needed (not needed for ETH)
-        if sell_token.upper() != "ETH":
+        if not _is_native_eth(sell_token):
             allowance_target = quote.get('allowanceTarget')
             if allowance_target:
-                await self.approve_token(sell_token, allowance_target, sell_amount)
+                # Quote's sellAmount covers buy_amount swaps as well
+                await self.approve_token(sell_token, allowance_target, int(quote['sellAmount']))
         
         # Execute swap
         tx_hash = await self.execute_swap(quote)
@@ -362,9 +421,14 @@ class ZeroXDataClient(LiveMarketDataClient):
             ("ARB", "USDC", 18, 6),   # ARB/USDC
         ]
         
+        # One timestamp for the whole load
+        ts_now = self._clock.timestamp_ns()
+        
         for base, quote, base_decimals, quote_decimals in pairs:
             symbol_str = f"{base}{quote}"
             instrument_id = InstrumentId(Symbol(symbol_str), VENUE)
+            price_increment = Price.from_str(f"0.{'0' * (quote_decimals - 1)}1")
+            size_increment = Quantity.from_str(f"0.{'0' * (base_decimals - 1)}1")
             
             instrument = CurrencyPair(
                 instrument_id=instrument_id,
@@ -373,18 +437,18 @@ class ZeroXDataClient(LiveMarketDataClient):
                 quote_currency=Currency.from_str(quote),
                 price_precision=quote_decimals,
                 size_precision=base_decimals,
-                price_increment=Price.from_str(f"0.{'0' * (quote_decimals - 1)}1"),
-                size_increment=Quantity.from_str(f"0.{'0' * (base_decimals - 1)}1"),
-                max_quantity=Quantity.from_str("1000000"),
-                min_quantity=Quantity.from_str(f"0.{'0' * (base_decimals - 1)}1"),
-                max_price=Price.from_str("1000000"),
-                min_price=Price.from_str(f"0.{'0' * (quote_decimals - 1)}1"),
-                margin_init=Decimal("1.0"),  # No margin on DEX
-                margin_maint=Decimal("1.0"),
-                maker_fee=Decimal("0.0"),  # 0x has no protocol fee
-                taker_fee=Decimal("0.0"),  # Gas is the only cost
-                ts_event=self._clock.timestamp_ns(),
-                ts_init=self._clock.timestamp_ns(),
+                price_increment=price_increment,
+                size_increment=size_increment,
+                max_quantity=MAX_QUANTITY,
+                min_quantity=size_increment,
+                max_price=MAX_PRICE,
+                min_price=price_increment,
+                margin_init=MARGIN,
+                margin_maint=MARGIN,
+                maker_fee=FEE,
+                taker_fee=FEE,
+                ts_event=ts_now,
+                ts_init=ts_now,
             )
             
             self._instruments[instrument_id] = instrument
@@ -449,11 +513,11 @@ class ZeroXExecutionClient(LiveExecutionClient):
     
     async def _update_account(self):
         """Update account state"""
-        # Get ETH balance
-        eth_balance = self._client.get_balance("ETH")
-        
-        # Get USDC balance
-        usdc_balance = self._client.get_balance(TOKENS_ARBITRUM["USDC"])
+        # Get ETH and USDC balances (blocking RPC, fetched concurrently off the loop)
+        eth_balance, usdc_balance = await asyncio.gather(
+            asyncio.to_thread(self._client.get_balance, "ETH"),
+            asyncio.to_thread(self._client.get_balance, TOKENS_ARBITRUM["USDC"]),
+        )
         
         self._log.info(f"ETH balance: {eth_balance:.4f}")
         self._log.info(f"USDC balance: {usdc_balance:.2f}")
@@ -467,33 +531,36 @@ class ZeroXExecutionClient(LiveExecutionClient):
         try:
             order = command.order
             
-            # Parse tokens from instrument
-            symbol = order.instrument_id.symbol.value
-            
-            # Map symbol to tokens (e.g., "WETHUSDC" -> WETH, USDC)
-            if symbol.startswith("WETH"):
-                sell_token = TOKENS_ARBITRUM["WETH"]
-                buy_token = TOKENS_ARBITRUM["USDC"]
-            else:
-                self._log.error(f"Unsupported symbol: {symbol}")
+            # Map instrument to tokens (e.g., WETHUSDC.ZEROX -> WETH, USDC)
+            tokens = SWAP_TOKENS.get(order.instrument_id)
+            if tokens is None:
+                self._log.error(f"Unsupported symbol: {order.instrument_id.symbol}")
                 return
             
-            # Determine direction
-            if order.side == OrderSide.BUY:
-                # Buy base with quote (sell USDC, buy WETH)
-                sell_token, buy_token = buy_token, sell_token
+            base_token, quote_token = tokens
             
-            # Calculate amount in wei
-            sell_amount = int(float(order.quantity) * 1e18)  # Assuming 18 decimals
+            # Order quantity is in base token units
+            decimals = await self._client.token_decimals(base_token)
+            amount = int(order.quantity.as_decimal().scaleb(decimals))
             
             # Execute swap
             self._log.info(f"Executing swap: {order.client_order_id}")
-            tx_hash = await self._client.swap(
-                sell_token=sell_token,
-                buy_token=buy_token,
-                sell_amount=sell_amount,
-                slippage_percentage=0.01,  # 1% slippage
-            )
+            if order.side == OrderSide.BUY:
+                # Buy exact base amount with quote (sell USDC, buy WETH)
+                tx_hash = await self._client.swap(
+                    sell_token=quote_token,
+                    buy_token=base_token,
+                    slippage_percentage=0.01,  # 1% slippage
+                    buy_amount=amount,
+                )
+            else:
+                # Sell exact base amount for quote (sell WETH, buy USDC)
+                tx_hash = await self._client.swap(
+                    sell_token=base_token,
+                    buy_token=quote_token,
+                    sell_amount=amount,
+                    slippage_percentage=0.01,  # 1% slippage
+                )
             
             self._log.info(f"Swap executed: {tx_hash}")
             # TODO: Generate fill event
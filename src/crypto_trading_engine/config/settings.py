@@ -7,14 +7,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 from pydantic import BaseModel, Field
-
-# For now, create a simple BaseSettings replacement
-class BaseSettings(BaseModel):
-    """Simple BaseSettings replacement for basic functionality."""
-    
-    class Config:
-        env_file = ".env"
-        env_nested_delimiter = "__"
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class ExchangeConfig(BaseModel):
@@ -47,6 +40,12 @@ class RiskConfig(BaseModel):
 class TradingEngineConfig(BaseSettings):
     """Main trading engine configuration."""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_nested_delimiter="__",
+        extra="ignore",
+    )
+    
     # Core settings
     trader_id: str = Field(default="TRADER-001", description="Unique trader ID")
     environment: str = Field(default="dev", description="Environment name")
@@ -62,15 +61,11 @@ class TradingEngineConfig(BaseSettings):
     risk: RiskConfig = Field(default_factory=RiskConfig)
     
     # Strategy settings
-    strategies_enabled: list[str] = Field(default_factory=list)
+    strategies_enabled: tuple[str, ...] = Field(default_factory=tuple)
     
     # Logging
     log_level: str = Field(default="INFO")
     log_file: Optional[str] = None
-    
-    class Config:
-        env_file = ".env"
-        env_nested_delimiter = "__"
 
 
 def load_config(environment: str = "dev", config_path: Optional[Path] = None) -> TradingEngineConfig:
@@ -87,16 +82,12 @@ def load_config(environment: str = "dev", config_path: Optional[Path] = None) ->
     # Set environment variable for pydantic-settings
     os.environ["ENVIRONMENT"] = environment
     
-    # Load base configuration
-    config = TradingEngineConfig()
-    
-    # Load environment-specific overrides
+    # Resolve the env file first so the config is validated only once:
+    # custom config file > environment-specific file > default .env
     env_config_path = Path(f"config/{environment}.env")
-    if env_config_path.exists():
-        config = TradingEngineConfig(_env_file=env_config_path)
-    
-    # Load custom config file if provided
     if config_path and config_path.exists():
-        config = TradingEngineConfig(_env_file=config_path)
+        return TradingEngineConfig(_env_file=config_path)
+    if env_config_path.exists():
+        return TradingEngineConfig(_env_file=env_config_path)
     
-    return config
\ No newline at end of file
+    return TradingEngineConfig()
\ No newline at end of file
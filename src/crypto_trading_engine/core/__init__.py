@@ -5,14 +5,6 @@ Contains the core interfaces and base classes for strategies, adapters,
 and engine management components.
 """
 
-from .strategy import Strategy
-from .adapter import ExchangeAdapter
-from .trading_mode_manager import TradingModeManager
-from .risk_manager import RiskManager
-
-__all__ = [
-    "Strategy",
-    "ExchangeAdapter", 
-    "TradingModeManager",
-    "RiskManager",
-]
\ No newline at end of file
+# The strategy, adapter, trading mode and risk manager modules are not
+# shipped yet; export them here once they exist
+__all__ = []
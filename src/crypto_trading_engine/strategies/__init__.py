@@ -7,9 +7,24 @@ This module contains implementations of sophisticated trading strategies includi
 - Arbitrage strategies
 """
 
-from .delta_neutral_nautilus import DeltaNeutralStrategy, DeltaNeutralConfig
+from importlib import import_module
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    'HyperliquidZeroXStrategy': '.hyperliquid_zerox_delta_neutral',
+    'HyperliquidZeroXConfig': '.hyperliquid_zerox_delta_neutral',
+}
 
 __all__ = [
-    'DeltaNeutralStrategy',
-    'DeltaNeutralConfig',
-]
\ No newline at end of file
+    'HyperliquidZeroXStrategy',
+    'HyperliquidZeroXConfig',
+]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -8,17 +8,23 @@ Strategy:
 - Earn funding rates on Hyperliquid shorts
 """
 
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.position import Position
 from nautilus_trader.trading.strategy import Strategy
 
 
+# Hyperliquid pays funding every 8 hours
+FUNDING_PERIODS_PER_YEAR = 365 * 3
+
+
 class HyperliquidZeroXConfig(StrategyConfig):
     """Configuration for Hyperliquid + 0x delta neutral strategy"""
     
@@ -29,6 +35,7 @@ class HyperliquidZeroXConfig(StrategyConfig):
     min_funding_rate_apy: float = 5.0
     max_leverage: float = 3.0
     emergency_exit_loss_pct: float = 10.0
+    profile_ticks: bool = False  # Time on_quote_tick (see tick_latency_summary)
 
 
 class HyperliquidZeroXStrategy(Strategy):
@@ -56,12 +63,27 @@ class HyperliquidZeroXStrategy(Strategy):
         self.min_funding_rate_apy = config.min_funding_rate_apy
         self.max_leverage = config.max_leverage
         self.emergency_exit_loss_pct = config.emergency_exit_loss_pct
+        self.profile_ticks = config.profile_ticks
+        
+        # Entry threshold expressed per funding period (avoids annualizing each tick)
+        self._min_funding_rate = self.min_funding_rate_apy / FUNDING_PERIODS_PER_YEAR
+        
+        # Rebalance threshold as a fraction of total position (compared without dividing)
+        self._rebalance_threshold = self.rebalance_threshold_pct / 100
+        
+        # Emergency exit loss as a fraction of entry price (P&L % only built when logging)
+        self._emergency_exit_loss = self.emergency_exit_loss_pct / 100
         
         # State
         self.spot_instrument: Optional[Instrument] = None
         self.perp_instrument: Optional[Instrument] = None
         self.current_funding_rate: float = 0.0
         self.entry_price: Optional[float] = None
+        
+        # Tick handler latency (only updated when profile_ticks is enabled)
+        self._tick_ns_total = 0
+        self._tick_ns_count = 0
+        self._tick_ns_max = 0
     
     def on_start(self):
         """Called when strategy starts"""
@@ -94,35 +116,69 @@ class HyperliquidZeroXStrategy(Strategy):
         # Close all positions
         self._close_all_positions()
         
+        if self.profile_ticks and self._tick_ns_count:
+            summary = self.tick_latency_summary()
+            self.log.info(
+                f"Tick latency: mean {summary['mean_ns']:.0f}ns, "
+                f"max {summary['max_ns']}ns over {summary['count']} ticks"
+            )
+        
         self.log.info("Strategy stopped")
     
     def on_quote_tick(self, tick: QuoteTick):
         """Handle quote tick"""
+        if not self.profile_ticks:
+            self._handle_quote_tick()
+            return
+        
+        t0 = time.perf_counter_ns()
+        self._handle_quote_tick()
+        elapsed = time.perf_counter_ns() - t0
+        
+        self._tick_ns_total += elapsed
+        self._tick_ns_count += 1
+        if elapsed > self._tick_ns_max:
+            self._tick_ns_max = elapsed
+    
+    def tick_latency_summary(self) -> Dict[str, Union[int, float]]:
+        """Get on_quote_tick latency stats (requires profile_ticks)"""
+        count = self._tick_ns_count
+        return {
+            "mean_ns": self._tick_ns_total / count if count else 0.0,
+            "max_ns": self._tick_ns_max,
+            "count": count,
+        }
+    
+    def _handle_quote_tick(self):
+        """Run entry/rebalance/exit checks for the latest quotes"""
+        # Look up both legs once per tick and share them with the checks
+        spot_position = self._open_position(self.spot_instrument_id)
+        perp_position = self._open_position(self.perp_instrument_id)
+        
         # Check if we should enter position
-        if not self._has_position():
+        if not self._has_position(spot_position, perp_position):
             self._check_entry_signal()
         else:
             # Check if we should rebalance
-            self._check_rebalance()
+            self._check_rebalance(spot_position, perp_position)
             
             # Check emergency exit
             self._check_emergency_exit()
     
-    def _has_position(self) -> bool:
+    def _open_position(self, instrument_id: InstrumentId) -> Optional[Position]:
+        """Get this strategy's open position for an instrument (None if flat)"""
+        positions = self.cache.positions_open(instrument_id=instrument_id, strategy_id=self.id)
+        return positions[0] if positions else None
+    
+    def _has_position(self, spot_position: Optional[Position], perp_position: Optional[Position]) -> bool:
         """Check if we have open positions"""
-        spot_position = self.cache.position_for_order(self.spot_instrument_id)
-        perp_position = self.cache.position_for_order(self.perp_instrument_id)
-        
-        return (spot_position is not None and spot_position.is_open) or \
-               (perp_position is not None and perp_position.is_open)
+        return spot_position is not None or perp_position is not None
     
     def _check_entry_signal(self):
         """Check if we should enter position"""
         # TODO: Get funding rate from Hyperliquid
         # For now, use placeholder
-        funding_rate_apy = self.current_funding_rate * 365 * 3  # 8h rate * 3 * 365
-        
-        if funding_rate_apy < self.min_funding_rate_apy:
+        if self.current_funding_rate < self._min_funding_rate:
             return
         
         # Get current prices
@@ -143,6 +199,7 @@ class HyperliquidZeroXStrategy(Strategy):
         
         spot_quantity = position_size_usd / spot_price
         perp_quantity = position_size_usd / perp_price
+        funding_rate_apy = self.current_funding_rate * FUNDING_PERIODS_PER_YEAR
         
         self.log.info(f"Entering position:")
         self.log.info(f"  Funding APY: {funding_rate_apy:.2f}%")
@@ -155,27 +212,22 @@ class HyperliquidZeroXStrategy(Strategy):
         
         self.entry_price = (spot_price + perp_price) / 2
     
-    def _check_rebalance(self):
+    def _check_rebalance(self, spot_position: Optional[Position], perp_position: Optional[Position]):
         """Check if we need to rebalance"""
-        spot_position = self.cache.position_for_order(self.spot_instrument_id)
-        perp_position = self.cache.position_for_order(self.perp_instrument_id)
-        
         if not spot_position or not perp_position:
             return
         
-        # Calculate delta
-        spot_delta = float(spot_position.quantity) if spot_position.is_long else -float(spot_position.quantity)
-        perp_delta = float(perp_position.quantity) if perp_position.is_long else -float(perp_position.quantity)
+        # Calculate delta (signed_qty is already a float, negative when short)
+        spot_delta = spot_position.signed_qty
+        perp_delta = perp_position.signed_qty
         
         net_delta = spot_delta + perp_delta
         total_position = abs(spot_delta) + abs(perp_delta)
         
-        if total_position == 0:
-            return
-        
-        delta_pct = abs(net_delta / total_position) * 100
-        
-        if delta_pct > self.rebalance_threshold_pct:
+        # Same as abs(net_delta / total_position) * 100 > threshold_pct, but
+        # with no division on the common in-band path (and safe when flat)
+        if abs(net_delta) > total_position * self._rebalance_threshold:
+            delta_pct = abs(net_delta / total_position) * 100
             self.log.info(f"Rebalancing: delta {delta_pct:.2f}% > {self.rebalance_threshold_pct}%")
             self._rebalance_positions()
     
@@ -193,10 +245,8 @@ class HyperliquidZeroXStrategy(Strategy):
         
         current_price = (float(spot_tick.bid_price) + float(perp_tick.ask_price)) / 2
         
-        # Calculate P&L
-        pnl_pct = ((current_price - self.entry_price) / self.entry_price) * 100
-        
-        if abs(pnl_pct) > self.emergency_exit_loss_pct:
+        if abs(current_price - self.entry_price) > self.entry_price * self._emergency_exit_loss:
+            pnl_pct = ((current_price - self.entry_price) / self.entry_price) * 100
             self.log.warning(f"Emergency exit: P&L {pnl_pct:.2f}% > {self.emergency_exit_loss_pct}%")
             self._close_all_positions()
     
@@ -229,15 +279,10 @@ class HyperliquidZeroXStrategy(Strategy):
         """Close all open positions"""
         self.log.info("Closing all positions...")
         
-        # Close spot position
-        spot_position = self.cache.position_for_order(self.spot_instrument_id)
-        if spot_position and spot_position.is_open:
-            self.close_position(spot_position)
-        
-        # Close perp position
-        perp_position = self.cache.position_for_order(self.perp_instrument_id)
-        if perp_position and perp_position.is_open:
-            self.close_position(perp_position)
+        # Close spot and perp positions
+        for instrument_id in (self.spot_instrument_id, self.perp_instrument_id):
+            for position in self.cache.positions_open(instrument_id=instrument_id, strategy_id=self.id):
+                self.close_position(position)
         
         self.entry_price = None
     
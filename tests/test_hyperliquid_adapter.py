@@ -0,0 +1,52 @@
+"""
+Tests for Hyperliquid order status handling in the execution client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from nautilus_trader.model.identifiers import ClientOrderId
+
+from crypto_trading_engine.adapters.hyperliquid_adapter import HyperliquidExecutionClient
+
+
+def make_exec_client(order_id_map=None) -> SimpleNamespace:
+    """Execution client state needed by _handle_order_status"""
+    return SimpleNamespace(_order_id_map=order_id_map or {}, _log=MagicMock())
+
+
+def make_order(client_order_id: str = "O-1") -> SimpleNamespace:
+    return SimpleNamespace(client_order_id=ClientOrderId(client_order_id))
+
+
+def test_resting_status_maps_exchange_order_id():
+    exec_client = make_exec_client()
+    order = make_order()
+    
+    HyperliquidExecutionClient._handle_order_status(exec_client, order, {"resting": {"oid": 77}})
+    
+    assert exec_client._order_id_map == {order.client_order_id: 77}
+
+
+def test_filled_status_drops_exchange_order_id():
+    order = make_order()
+    exec_client = make_exec_client({order.client_order_id: 77})
+    
+    HyperliquidExecutionClient._handle_order_status(
+        exec_client, order, {"filled": {"totalSz": "0.1", "avgPx": "3000.0", "oid": 77}}
+    )
+    
+    assert exec_client._order_id_map == {}
+
+
+def test_error_status_is_logged_and_not_mapped():
+    exec_client = make_exec_client()
+    order = make_order()
+    
+    HyperliquidExecutionClient._handle_order_status(exec_client, order, {"error": "Insufficient margin"})
+    
+    assert exec_client._order_id_map == {}
+    exec_client._log.error.assert_called_once()
+    message = exec_client._log.error.call_args.args[0]
+    assert "O-1" in message
+    assert "Insufficient margin" in message
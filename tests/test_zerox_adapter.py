@@ -0,0 +1,108 @@
+"""
+Tests for 0x swap sizing and routing in the 0x execution client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import ClientOrderId, InstrumentId
+from nautilus_trader.model.objects import Quantity
+
+from crypto_trading_engine.adapters.zerox_adapter import (
+    TOKENS_ARBITRUM,
+    ZeroXExecutionClient,
+    ZeroXHttpClient,
+)
+
+
+def make_exec_client(decimals: int = 18) -> SimpleNamespace:
+    """Execution client state with a mocked 0x HTTP client"""
+    client = MagicMock()
+    client.token_decimals = AsyncMock(return_value=decimals)
+    client.swap = AsyncMock(return_value="0xabc")
+    return SimpleNamespace(_client=client, _log=MagicMock())
+
+
+def make_submit(side: OrderSide, symbol: str = "WETHUSDC", quantity: str = "1.5") -> SimpleNamespace:
+    """SubmitOrder command carrying a market order"""
+    order = SimpleNamespace(
+        instrument_id=InstrumentId.from_str(f"{symbol}.ZEROX"),
+        side=side,
+        quantity=Quantity.from_str(quantity),
+        client_order_id=ClientOrderId("O-1"),
+    )
+    return SimpleNamespace(order=order)
+
+
+@pytest.mark.asyncio
+async def test_buy_quotes_buy_amount_in_base_units():
+    exec_client = make_exec_client(decimals=18)
+    
+    await ZeroXExecutionClient._submit_order(exec_client, make_submit(OrderSide.BUY))
+    
+    exec_client._client.token_decimals.assert_awaited_once_with(TOKENS_ARBITRUM["WETH"])
+    exec_client._client.swap.assert_awaited_once_with(
+        sell_token=TOKENS_ARBITRUM["USDC"],
+        buy_token=TOKENS_ARBITRUM["WETH"],
+        slippage_percentage=0.01,
+        buy_amount=1_500_000_000_000_000_000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sell_quotes_sell_amount_in_base_units():
+    exec_client = make_exec_client(decimals=18)
+    
+    await ZeroXExecutionClient._submit_order(exec_client, make_submit(OrderSide.SELL))
+    
+    exec_client._client.swap.assert_awaited_once_with(
+        sell_token=TOKENS_ARBITRUM["WETH"],
+        buy_token=TOKENS_ARBITRUM["USDC"],
+        sell_amount=1_500_000_000_000_000_000,
+        slippage_percentage=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_amount_uses_base_token_decimals():
+    exec_client = make_exec_client(decimals=8)
+    
+    await ZeroXExecutionClient._submit_order(exec_client, make_submit(OrderSide.SELL, quantity="0.25"))
+    
+    assert exec_client._client.swap.await_args.kwargs["sell_amount"] == 25_000_000
+
+
+@pytest.mark.asyncio
+async def test_wethusdt_routes_to_usdt():
+    exec_client = make_exec_client()
+    
+    await ZeroXExecutionClient._submit_order(exec_client, make_submit(OrderSide.BUY, symbol="WETHUSDT"))
+    
+    kwargs = exec_client._client.swap.await_args.kwargs
+    assert kwargs["sell_token"] == TOKENS_ARBITRUM["USDT"]
+    assert kwargs["buy_token"] == TOKENS_ARBITRUM["WETH"]
+
+
+@pytest.mark.asyncio
+async def test_unsupported_symbol_is_not_swapped():
+    exec_client = make_exec_client()
+    
+    await ZeroXExecutionClient._submit_order(exec_client, make_submit(OrderSide.BUY, symbol="ARBUSDC"))
+    
+    exec_client._client.swap.assert_not_awaited()
+    exec_client._log.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("amounts", [{}, {"sell_amount": 1, "buy_amount": 1}])
+async def test_quote_requires_exactly_one_amount(amounts):
+    with pytest.raises(ValueError):
+        await ZeroXHttpClient.get_quote(
+            SimpleNamespace(),
+            sell_token=TOKENS_ARBITRUM["WETH"],
+            buy_token=TOKENS_ARBITRUM["USDC"],
+            **amounts,
+        )